@@ -1,11 +1,20 @@
 #!/usr/bin/env python3
 
 import asyncio
+import errno
+import heapq
+import io
+import ntpath
 import os
+import shutil
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Iterator
 import sys
 
 from mcp.server import Server
@@ -15,167 +24,378 @@ from mcp.types import Tool, TextContent
 # Get user's Downloads and Documents directories
 DOWNLOADS_DIR = Path.home() / "Downloads"
 DOCUMENTS_DIR = Path.home() / "Documents"
+DOWNLOADS_STR = os.fspath(DOWNLOADS_DIR)
+DOCUMENTS_STR = os.fspath(DOCUMENTS_DIR)
+
+# Longest file listing returned in a single tool response
+MAX_LISTED_FILES = 500
+
+# Archives with fewer non-empty files than this are extracted on the calling thread
+PARALLEL_EXTRACT_MIN_FILES = 16
+
+
+@lru_cache(maxsize=2048)
+def _fmt_mtime(sec: int) -> str:
+    # Files unpacked or downloaded together often share the same second
+    return datetime.fromtimestamp(sec).strftime("%m/%d/%Y, %I:%M %p")
+
+
+def _format_listing(items: Iterable[str], total: int) -> str:
+    # Only the first MAX_LISTED_FILES items are joined (or even generated)
+    text = "\n".join(islice(items, MAX_LISTED_FILES))
+    if total > MAX_LISTED_FILES:
+        text += f"\n… and {total - MAX_LISTED_FILES} more"
+    return text
+
+
+def _user_path(path) -> Path:
+    # Only pay for realpath() when ".." could be traversing a symlink
+    if ".." in Path(path).parts:
+        return Path(path).resolve()
+    return Path(os.path.abspath(path))
+
+
+def _destination_dir(destination: Optional[str]) -> Path:
+    if not destination:
+        return DOWNLOADS_DIR
+    dest = destination.lower()
+    if dest == "downloads":
+        return DOWNLOADS_DIR
+    if dest == "documents":
+        return DOCUMENTS_DIR
+    return _user_path(destination)
+
+
+def _zip_entries() -> List[os.DirEntry]:
+    with os.scandir(DOWNLOADS_STR) as it:
+        return [e for e in it if e.is_file() and e.name.lower().endswith(".zip")]
+
+
+def _scandir_recursive(path: str, suffix: str):
+    # Walk with os.scandir so type checks come from the cached DirEntry
+    try:
+        it = os.scandir(path)
+    except OSError:
+        # Skip folders that are unreadable, vanished or not folders, as rglob did
+        return
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scandir_recursive(entry.path, suffix)
+            elif entry.name.lower().endswith(suffix) and entry.is_file(follow_symlinks=False):
+                yield entry.path
+
+
+def _unique_dest(dest_dir: str, stem: str, suffix: str) -> str:
+    # Claim the name atomically with O_EXCL, adding a counter on collisions
+    candidate = os.path.join(dest_dir, f"{stem}{suffix}")
+    counter = 1
+    while True:
+        try:
+            fd = os.open(candidate, os.O_WRONLY | os.O_CREAT | os.O_EXCL)
+        except FileExistsError:
+            candidate = os.path.join(dest_dir, f"{stem}_{counter}{suffix}")
+            counter += 1
+        else:
+            os.close(fd)
+            return candidate
+
+
+def _release_dest(dest: str) -> None:
+    # Remove a name claimed by _unique_dest that didn't receive a file
+    try:
+        os.unlink(dest)
+    except FileNotFoundError:
+        pass
+
+
+def _move_file(move: tuple) -> str:
+    src, dest = move
+    try:
+        try:
+            os.replace(src, dest)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            # shutil.move copies then deletes the source, so a failure
+            # leaves the source in place and dest safe to drop
+            shutil.move(src, dest)
+    except BaseException:
+        _release_dest(dest)
+        raise
+    return os.path.basename(dest)
+
+
+def _move_files(files: List[str], dest_dir: Path) -> List[str]:
+    # Claim destination names serially, then overlap the renames;
+    # paths stay plain strings so os.replace needs no pathlib conversion
+    dest_dir_str = os.fspath(dest_dir)
+    moves = []
+    try:
+        for src in files:
+            stem, suffix = os.path.splitext(os.path.basename(src))
+            moves.append((src, _unique_dest(dest_dir_str, stem, suffix)))
+    except BaseException:
+        for _, dest in moves:
+            _release_dest(dest)
+        raise
+    with ThreadPoolExecutor() as executor:
+        return list(executor.map(_move_file, moves))
+
+
+def _member_relpath(name: str) -> str:
+    # Reject members that would land outside the extract folder (Zip Slip).
+    # Rooted ("/x", "\\x") and drive-rooted ("C:/x") names are checked on the
+    # raw name so they are refused on every platform, before any cleanup
+    drive, rest = ntpath.splitdrive(name)
+    if name.startswith(("/", "\\")) or (drive and rest.startswith(("/", "\\"))):
+        raise ValueError(f"Unsafe path in zip file: {name}")
+    relpath = os.path.normpath(name)
+    if relpath == os.pardir or relpath.startswith(os.pardir + os.sep):
+        raise ValueError(f"Unsafe path in zip file: {name}")
+    if os.sep == "\\":
+        # Same cleanup extractall does for characters Windows can't store;
+        # this also turns "a:b.svg" into "a_b.svg" instead of a drive path
+        relpath = zipfile.ZipFile._sanitize_windows_name(relpath, os.sep)
+    if os.path.splitdrive(relpath)[0]:
+        raise ValueError(f"Unsafe path in zip file: {name}")
+    return "" if relpath in ("", os.curdir) else relpath
+
+
+def _target_key(target: str) -> str:
+    # Fold case the way the default filesystem on this platform compares names
+    if sys.platform == "darwin":
+        return target.casefold()
+    return os.path.normcase(target)
+
+
+def _fast_extract_one(zip_ref: zipfile.ZipFile, info: zipfile.ZipInfo, target: str) -> None:
+    # Size the copy buffer to the member so small files take a single read/write
+    bufsize = min(max(info.file_size, io.DEFAULT_BUFFER_SIZE), 1 << 20)
+    with zip_ref.open(info) as src, open(target, "wb", buffering=bufsize) as dst:
+        shutil.copyfileobj(src, dst, bufsize)
+
+
+def _extract_members(zip_path: str, jobs: List[tuple]) -> None:
+    # Each worker gets its own ZipFile handle so decompression state isn't shared
+    with zipfile.ZipFile(zip_path, "r") as zip_ref:
+        for info, target in jobs:
+            _fast_extract_one(zip_ref, info, target)
+
+
+def _extract_zip(zip_path: str, extract_path: str) -> List[str]:
+    with zipfile.ZipFile(zip_path, "r") as zip_ref:
+        infos = zip_ref.infolist()
+
+    dirs = set()
+    files = {}
+    # Validate every member before anything is written to disk
+    for info in infos:
+        relpath = _member_relpath(info.filename)
+        if not relpath:
+            continue
+        target = os.path.join(extract_path, relpath)
+        parent = relpath if info.is_dir() else os.path.dirname(relpath)
+        # Record every ancestor so each directory is a single mkdir below
+        while parent and parent not in dirs:
+            dirs.add(parent)
+            parent = os.path.dirname(parent)
+        if info.is_dir():
+            continue
+        # Duplicate names are legal; like extractall, the last one wins.
+        # Names differing only by case are the same file on Windows/macOS
+        files[_target_key(target)] = (info, target)
+
+    empty_files = [target for info, target in files.values() if info.file_size == 0]
+    jobs = [(info, target) for info, target in files.values() if info.file_size]
+
+    # Nothing is created until every member has passed validation
+    os.makedirs(extract_path, exist_ok=True)
+
+    # Build the directory tree up front so workers only open files;
+    # sorting by length creates parents before their children
+    for d in sorted(dirs, key=len):
+        try:
+            os.mkdir(os.path.join(extract_path, d))
+        except FileExistsError:
+            pass
+    for target in empty_files:
+        open(target, "wb").close()
+
+    # DEFLATE releases the GIL inside zlib, so members decompress in parallel
+    if len(jobs) < PARALLEL_EXTRACT_MIN_FILES:
+        _extract_members(zip_path, jobs)
+    else:
+        workers = min(os.cpu_count() or 1, len(jobs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(_extract_members, [zip_path] * workers, [jobs[i::workers] for i in range(workers)]))
+
+    return [info.filename for info in infos]
+
+
+# Tool schemas never change, so they are built once at import
+_TOOLS: list[Tool] = [
+    Tool(
+        name="unzip_file",
+        description="Unzip a file from the Downloads directory. You can specify where to extract it, or it will extract to Downloads by default.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {
+                    "type": "string",
+                    "description": "Name of the zip file in Downloads (e.g., 'archive.zip')",
+                },
+                "destination": {
+                    "type": "string",
+                    "description": "Optional: Where to extract files (defaults to Downloads). Use 'downloads' or 'documents' or a specific path.",
+                },
+            },
+            "required": ["filename"],
+        },
+    ),
+    Tool(
+        name="move_svg_files",
+        description="Find and move all SVG files from Downloads to Documents directory. Can move to a specific subfolder in Documents (e.g., 'DoorHanger', 'Icons', 'Graphics').",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "source": {
+                    "type": "string",
+                    "description": "Optional: Source directory to search for SVG files (defaults to Downloads). Can be a path relative to Downloads if unzipping created a subfolder.",
+                },
+                "subfolder": {
+                    "type": "string",
+                    "description": "Optional: Subfolder name in Documents where SVG files should be moved (e.g., 'DoorHanger', 'Projects/Icons'). Will be created if it doesn't exist.",
+                },
+            },
+        },
+    ),
+    Tool(
+        name="list_zip_files",
+        description="List all zip files in the Downloads directory, sorted by date (newest first)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "limit": {
+                    "type": "number",
+                    "description": "Optional: Maximum number of files to show (default: 10)",
+                },
+            },
+        },
+    ),
+    Tool(
+        name="list_svg_files",
+        description="List all SVG files in Downloads or a specified directory",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "directory": {
+                    "type": "string",
+                    "description": "Optional: Directory to search (defaults to Downloads)",
+                },
+            },
+        },
+    ),
+    Tool(
+        name="unzip_and_move_svgs",
+        description="Combined operation: Unzip a file and then move all SVG files from the extracted folder to a specified location in Documents. Perfect for 'unzip project.zip and move SVGs to DoorHanger' requests.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {
+                    "type": "string",
+                    "description": "Name of the zip file in Downloads (e.g., 'project.zip')",
+                },
+                "destination_folder": {
+                    "type": "string",
+                    "description": "Subfolder in Documents where SVG files should go (e.g., 'DoorHanger', 'Icons')",
+                },
+            },
+            "required": ["filename", "destination_folder"],
+        },
+    ),
+    Tool(
+        name="list_recent_downloads",
+        description="Show the most recently downloaded files in the Downloads directory",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "limit": {
+                    "type": "number",
+                    "description": "Optional: Number of recent files to show (default: 10)",
+                },
+                "file_type": {
+                    "type": "string",
+                    "description": "Optional: Filter by file extension (e.g., 'zip', 'pdf', 'svg')",
+                },
+            },
+        },
+    ),
+    Tool(
+        name="unzip_latest",
+        description="Unzip the most recently downloaded zip file from Downloads",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "destination": {
+                    "type": "string",
+                    "description": "Optional: Where to extract files (defaults to Downloads). Use 'downloads' or 'documents' or a specific path.",
+                },
+            },
+        },
+    ),
+    Tool(
+        name="unzip_latest_and_move_svgs",
+        description="Unzip the most recently downloaded zip file and move all SVG files to a specified folder in Documents",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "destination_folder": {
+                    "type": "string",
+                    "description": "Subfolder in Documents where SVG files should go (e.g., 'DoorHanger', 'Icons')",
+                },
+            },
+            "required": ["destination_folder"],
+        },
+    ),
+]
 
 
 class FileManagerServer:
     def __init__(self):
         self.server = Server("file-manager")
+        self._known_dirs: set[str] = set()
+        self._dispatch = {
+            "unzip_file": self.handle_unzip,
+            "move_svg_files": self.handle_move_svg,
+            "list_zip_files": self.handle_list_zip,
+            "list_svg_files": self.handle_list_svg,
+            "unzip_and_move_svgs": self.handle_unzip_and_move_svgs,
+            "list_recent_downloads": self.handle_list_recent_downloads,
+            "unzip_latest": self.handle_unzip_latest,
+            "unzip_latest_and_move_svgs": self.handle_unzip_latest_and_move_svgs,
+        }
         self.setup_handlers()
 
     def setup_handlers(self):
         @self.server.list_tools()
         async def list_tools() -> list[Tool]:
-            return [
-                Tool(
-                    name="unzip_file",
-                    description="Unzip a file from the Downloads directory. You can specify where to extract it, or it will extract to Downloads by default.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "filename": {
-                                "type": "string",
-                                "description": "Name of the zip file in Downloads (e.g., 'archive.zip')",
-                            },
-                            "destination": {
-                                "type": "string",
-                                "description": "Optional: Where to extract files (defaults to Downloads). Use 'downloads' or 'documents' or a specific path.",
-                            },
-                        },
-                        "required": ["filename"],
-                    },
-                ),
-                Tool(
-                    name="move_svg_files",
-                    description="Find and move all SVG files from Downloads to Documents directory. Can move to a specific subfolder in Documents (e.g., 'DoorHanger', 'Icons', 'Graphics').",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "source": {
-                                "type": "string",
-                                "description": "Optional: Source directory to search for SVG files (defaults to Downloads). Can be a path relative to Downloads if unzipping created a subfolder.",
-                            },
-                            "subfolder": {
-                                "type": "string",
-                                "description": "Optional: Subfolder name in Documents where SVG files should be moved (e.g., 'DoorHanger', 'Projects/Icons'). Will be created if it doesn't exist.",
-                            },
-                        },
-                    },
-                ),
-                Tool(
-                    name="list_zip_files",
-                    description="List all zip files in the Downloads directory, sorted by date (newest first)",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "limit": {
-                                "type": "number",
-                                "description": "Optional: Maximum number of files to show (default: 10)",
-                            },
-                        },
-                    },
-                ),
-                Tool(
-                    name="list_svg_files",
-                    description="List all SVG files in Downloads or a specified directory",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "directory": {
-                                "type": "string",
-                                "description": "Optional: Directory to search (defaults to Downloads)",
-                            },
-                        },
-                    },
-                ),
-                Tool(
-                    name="unzip_and_move_svgs",
-                    description="Combined operation: Unzip a file and then move all SVG files from the extracted folder to a specified location in Documents. Perfect for 'unzip project.zip and move SVGs to DoorHanger' requests.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "filename": {
-                                "type": "string",
-                                "description": "Name of the zip file in Downloads (e.g., 'project.zip')",
-                            },
-                            "destination_folder": {
-                                "type": "string",
-                                "description": "Subfolder in Documents where SVG files should go (e.g., 'DoorHanger', 'Icons')",
-                            },
-                        },
-                        "required": ["filename", "destination_folder"],
-                    },
-                ),
-                Tool(
-                    name="list_recent_downloads",
-                    description="Show the most recently downloaded files in the Downloads directory",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "limit": {
-                                "type": "number",
-                                "description": "Optional: Number of recent files to show (default: 10)",
-                            },
-                            "file_type": {
-                                "type": "string",
-                                "description": "Optional: Filter by file extension (e.g., 'zip', 'pdf', 'svg')",
-                            },
-                        },
-                    },
-                ),
-                Tool(
-                    name="unzip_latest",
-                    description="Unzip the most recently downloaded zip file from Downloads",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "destination": {
-                                "type": "string",
-                                "description": "Optional: Where to extract files (defaults to Downloads). Use 'downloads' or 'documents' or a specific path.",
-                            },
-                        },
-                    },
-                ),
-                Tool(
-                    name="unzip_latest_and_move_svgs",
-                    description="Unzip the most recently downloaded zip file and move all SVG files to a specified folder in Documents",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "destination_folder": {
-                                "type": "string",
-                                "description": "Subfolder in Documents where SVG files should go (e.g., 'DoorHanger', 'Icons')",
-                            },
-                        },
-                        "required": ["destination_folder"],
-                    },
-                ),
-            ]
+            return _TOOLS
 
         @self.server.call_tool()
         async def call_tool(name: str, arguments: dict) -> list[TextContent]:
             try:
-                if name == "unzip_file":
-                    return await self.handle_unzip(arguments)
-                elif name == "move_svg_files":
-                    return await self.handle_move_svg(arguments)
-                elif name == "list_zip_files":
-                    return await self.handle_list_zip(arguments)
-                elif name == "list_svg_files":
-                    return await self.handle_list_svg(arguments)
-                elif name == "unzip_and_move_svgs":
-                    return await self.handle_unzip_and_move_svgs(arguments)
-                elif name == "list_recent_downloads":
-                    return await self.handle_list_recent_downloads(arguments)
-                elif name == "unzip_latest":
-                    return await self.handle_unzip_latest(arguments)
-                elif name == "unzip_latest_and_move_svgs":
-                    return await self.handle_unzip_latest_and_move_svgs(arguments)
-                else:
+                handler = self._dispatch.get(name)
+                if handler is None:
                     raise ValueError(f"Unknown tool: {name}")
+                return await handler(arguments)
             except Exception as e:
                 return [TextContent(type="text", text=f"Error: {str(e)}")]
 
     async def handle_unzip(self, args: dict) -> list[TextContent]:
+        return await asyncio.to_thread(self._sync_unzip, args)
+
+    def _sync_unzip(self, args: dict) -> list[TextContent]:
         filename = args.get("filename")
         if not filename:
             raise ValueError("filename is required")
@@ -185,34 +405,21 @@ class FileManagerServer:
         if not zip_path.exists():
             raise ValueError(f"Zip file not found: {filename}")
 
-        # Determine destination
-        dest_dir = DOWNLOADS_DIR
-        if "destination" in args:
-            dest = args["destination"].lower()
-            if dest == "downloads":
-                dest_dir = DOWNLOADS_DIR
-            elif dest == "documents":
-                dest_dir = DOCUMENTS_DIR
-            else:
-                dest_dir = Path(args["destination"]).resolve()
-
-        # Extract zip
-        extract_path = dest_dir / zip_path.stem
-        extract_path.mkdir(parents=True, exist_ok=True)
-
-        with zipfile.ZipFile(zip_path, "r") as zip_ref:
-            zip_ref.extractall(extract_path)
-            file_list = zip_ref.namelist()
+        dest_dir = _destination_dir(args.get("destination"))
+        extract_path, file_list = self._do_unzip_core(os.fspath(zip_path), dest_dir)
 
         return [
             TextContent(
                 type="text",
-                text=f"Successfully unzipped {filename} to {extract_path}\n\nExtracted {len(file_list)} files:\n" + "\n".join(file_list),
+                text=f"Successfully unzipped {filename} to {extract_path}\n\nExtracted {len(file_list)} files:\n" + _format_listing(file_list, len(file_list)),
             )
         ]
 
     async def handle_move_svg(self, args: dict) -> list[TextContent]:
-        source_dir = Path(args.get("source", DOWNLOADS_DIR)).resolve()
+        return await asyncio.to_thread(self._sync_move_svg, args)
+
+    def _sync_move_svg(self, args: dict) -> list[TextContent]:
+        source_dir = _user_path(args.get("source", DOWNLOADS_STR))
 
         if not source_dir.exists():
             raise ValueError(f"Source directory not found: {source_dir}")
@@ -221,10 +428,10 @@ class FileManagerServer:
         dest_dir = DOCUMENTS_DIR
         if "subfolder" in args:
             dest_dir = DOCUMENTS_DIR / args["subfolder"]
-            dest_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(dest_dir)
 
         # Find all SVG files recursively
-        svg_files = await self.find_files(source_dir, ".svg")
+        svg_files = list(self.find_files(source_dir, ".svg"))
 
         if not svg_files:
             return [
@@ -234,81 +441,68 @@ class FileManagerServer:
             ]
 
         # Move each SVG file
-        moved_files = []
-        for svg_path in svg_files:
-            filename = svg_path.name
-            dest_path = dest_dir / filename
-
-            # Handle duplicate filenames
-            final_dest_path = dest_path
-            counter = 1
-            while final_dest_path.exists():
-                stem = svg_path.stem
-                suffix = svg_path.suffix
-                final_dest_path = dest_dir / f"{stem}_{counter}{suffix}"
-                counter += 1
-
-            svg_path.rename(final_dest_path)
-            moved_files.append(final_dest_path.name)
+        moved_files = _move_files(svg_files, dest_dir)
 
         return [
             TextContent(
                 type="text",
-                text=f"Successfully moved {len(moved_files)} SVG file(s) from {source_dir} to {dest_dir}\n\nMoved files:\n" + "\n".join(moved_files),
+                text=f"Successfully moved {len(moved_files)} SVG file(s) from {source_dir} to {dest_dir}\n\nMoved files:\n" + _format_listing(moved_files, len(moved_files)),
             )
         ]
 
     async def handle_list_zip(self, args: dict) -> list[TextContent]:
+        return await asyncio.to_thread(self._sync_list_zip, args)
+
+    def _sync_list_zip(self, args: dict) -> list[TextContent]:
         limit = args.get("limit", 10)
         
         if not DOWNLOADS_DIR.exists():
             raise ValueError(f"Downloads directory not found: {DOWNLOADS_DIR}")
 
-        zip_files = [f for f in DOWNLOADS_DIR.iterdir() if f.is_file() and f.suffix.lower() == ".zip"]
+        # Get (name, size, mtime) from the DirEntry's stat
+        file_details = []
+        with os.scandir(DOWNLOADS_STR) as it:
+            for entry in it:
+                if not entry.is_file():
+                    continue
+                if not entry.name.lower().endswith(".zip"):
+                    continue
+                stats = entry.stat()
+                file_details.append((entry.name, stats.st_size, stats.st_mtime))
 
-        if not zip_files:
+        if not file_details:
             return [
                 TextContent(
                     type="text", text=f"No zip files found in {DOWNLOADS_DIR}"
                 )
             ]
 
-        # Get file details with timestamps
-        file_details = []
-        for file in zip_files:
-            stats = file.stat()
-            file_details.append({
-                "name": file.name,
-                "size": stats.st_size,
-                "modified": datetime.fromtimestamp(stats.st_mtime),
-            })
-
-        # Sort by modified date (newest first)
-        file_details.sort(key=lambda x: x["modified"], reverse=True)
-
-        # Limit results
-        limited_files = file_details[:limit]
+        # Newest first, only ordering the entries we keep
+        limited_files = heapq.nlargest(limit, file_details, key=itemgetter(2))
 
         file_list = []
-        for file in limited_files:
-            size_mb = file["size"] / (1024 * 1024)
-            date_str = file["modified"].strftime("%m/%d/%Y, %I:%M %p")
-            file_list.append(f"{file['name']} ({size_mb:.2f} MB) - {date_str}")
+        for name, size, mtime in limited_files:
+            size_mb = size / (1024 * 1024)
+            date_str = _fmt_mtime(int(mtime))
+            file_list.append(f"{name} ({size_mb:.2f} MB) - {date_str}")
 
         return [
             TextContent(
                 type="text",
-                text=f"Found {len(zip_files)} zip file(s) in Downloads (showing {len(limited_files)} most recent):\n\n" + "\n".join(file_list),
+                text=f"Found {len(file_details)} zip file(s) in Downloads (showing {len(limited_files)} most recent):\n\n" + "\n".join(file_list),
             )
         ]
 
     async def handle_list_svg(self, args: dict) -> list[TextContent]:
-        search_dir = Path(args.get("directory", DOWNLOADS_DIR)).resolve()
+        return await asyncio.to_thread(self._sync_list_svg, args)
+
+    def _sync_list_svg(self, args: dict) -> list[TextContent]:
+        search_dir = _user_path(args.get("directory", DOWNLOADS_STR))
 
         if not search_dir.exists():
             raise ValueError(f"Directory not found: {search_dir}")
 
-        svg_files = await self.find_files(search_dir, ".svg")
+        svg_files = list(self.find_files(search_dir, ".svg"))
 
         if not svg_files:
             return [
@@ -317,16 +511,19 @@ class FileManagerServer:
                 )
             ]
 
-        relative_paths = [str(f.relative_to(search_dir)) for f in svg_files]
+        relative_paths = (os.path.relpath(f, search_dir) for f in svg_files)
 
         return [
             TextContent(
                 type="text",
-                text=f"Found {len(svg_files)} SVG file(s) in {search_dir}:\n\n" + "\n".join(relative_paths),
+                text=f"Found {len(svg_files)} SVG file(s) in {search_dir}:\n\n" + _format_listing(relative_paths, len(svg_files)),
             )
         ]
 
     async def handle_unzip_and_move_svgs(self, args: dict) -> list[TextContent]:
+        return await asyncio.to_thread(self._sync_unzip_and_move_svgs, args)
+
+    def _sync_unzip_and_move_svgs(self, args: dict) -> list[TextContent]:
         filename = args.get("filename")
         destination_folder = args.get("destination_folder")
 
@@ -335,21 +532,20 @@ class FileManagerServer:
         if not destination_folder:
             raise ValueError("destination_folder is required")
 
-        # Step 1: Unzip the file
         zip_path = DOWNLOADS_DIR / filename
 
         if not zip_path.exists():
             raise ValueError(f"Zip file not found: {filename}")
 
-        extract_path = DOWNLOADS_DIR / zip_path.stem
-        extract_path.mkdir(parents=True, exist_ok=True)
+        return self._unzip_and_move_svgs(os.fspath(zip_path), filename, destination_folder)
 
-        with zipfile.ZipFile(zip_path, "r") as zip_ref:
-            zip_ref.extractall(extract_path)
-            total_files = len(zip_ref.namelist())
+    def _unzip_and_move_svgs(self, zip_path: str, filename: str, destination_folder: str) -> list[TextContent]:
+        # Step 1: Unzip the file
+        extract_path, file_list = self._do_unzip_core(zip_path, DOWNLOADS_DIR)
+        total_files = len(file_list)
 
         # Step 2: Find all SVG files in the extracted folder
-        svg_files = await self.find_files(extract_path, ".svg")
+        svg_files = list(self.find_files(extract_path, ".svg"))
 
         if not svg_files:
             return [
@@ -361,60 +557,42 @@ class FileManagerServer:
 
         # Step 3: Create destination folder in Documents
         dest_dir = DOCUMENTS_DIR / destination_folder
-        dest_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(dest_dir)
 
         # Step 4: Move each SVG file
-        moved_files = []
-        for svg_path in svg_files:
-            filename_svg = svg_path.name
-            dest_path = dest_dir / filename_svg
-
-            # Handle duplicate filenames
-            final_dest_path = dest_path
-            counter = 1
-            while final_dest_path.exists():
-                stem = svg_path.stem
-                suffix = svg_path.suffix
-                final_dest_path = dest_dir / f"{stem}_{counter}{suffix}"
-                counter += 1
-
-            svg_path.rename(final_dest_path)
-            moved_files.append(final_dest_path.name)
+        moved_files = _move_files(svg_files, dest_dir)
 
         return [
             TextContent(
                 type="text",
-                text=f"Success! 🎉\n\n1. Unzipped {args['filename']} ({total_files} total files)\n2. Found {len(svg_files)} SVG file(s)\n3. Moved all SVGs to Documents\\{destination_folder}\n\nMoved files:\n" + "\n".join(moved_files),
+                text=f"Success! 🎉\n\n1. Unzipped {filename} ({total_files} total files)\n2. Found {len(svg_files)} SVG file(s)\n3. Moved all SVGs to Documents\\{destination_folder}\n\nMoved files:\n" + _format_listing(moved_files, len(moved_files)),
             )
         ]
 
     async def handle_list_recent_downloads(self, args: dict) -> list[TextContent]:
+        return await asyncio.to_thread(self._sync_list_recent_downloads, args)
+
+    def _sync_list_recent_downloads(self, args: dict) -> list[TextContent]:
         limit = args.get("limit", 10)
         file_type = args.get("file_type", "").lower()
 
         if not DOWNLOADS_DIR.exists():
             raise ValueError(f"Downloads directory not found: {DOWNLOADS_DIR}")
 
-        # Get file details
+        # Get raw file details, applying the file type filter before stat()
+        suffix = f".{file_type}"
         file_details = []
-        for file in DOWNLOADS_DIR.iterdir():
-            if file.is_file():
-                try:
-                    stats = file.stat()
-                    extension = file.suffix.lower().lstrip(".")
-                    file_details.append({
-                        "name": file.name,
-                        "size": stats.st_size,
-                        "modified": datetime.fromtimestamp(stats.st_mtime),
-                        "extension": extension,
-                    })
-                except Exception:
-                    # Skip files we can't access
-                    pass
-
-        # Apply file type filter
-        if file_type:
-            file_details = [f for f in file_details if f["extension"] == file_type]
+        with os.scandir(DOWNLOADS_STR) as it:
+            for file in it:
+                if file_type and not file.name.lower().endswith(suffix):
+                    continue
+                if file.is_file():
+                    try:
+                        stats = file.stat()
+                        file_details.append((file.name, stats.st_size, stats.st_mtime))
+                    except Exception:
+                        # Skip files we can't access
+                        pass
 
         if not file_details:
             type_msg = f" of type '{file_type}'" if file_type else ""
@@ -424,23 +602,19 @@ class FileManagerServer:
                 )
             ]
 
-        # Sort by modified date (newest first)
-        file_details.sort(key=lambda x: x["modified"], reverse=True)
-
-        # Limit results
-        limited_files = file_details[:limit]
+        # Newest first, only ordering the entries we keep
+        limited_files = heapq.nlargest(limit, file_details, key=itemgetter(2))
 
         file_list = []
-        for index, file in enumerate(limited_files):
-            size = file["size"]
+        for index, (name, size, mtime) in enumerate(limited_files):
             if size > 1024 * 1024:
                 display_size = f"{size / (1024 * 1024):.2f} MB"
             else:
                 display_size = f"{size / 1024:.2f} KB"
             
-            date_str = file["modified"].strftime("%m/%d/%Y, %I:%M %p")
+            date_str = _fmt_mtime(int(mtime))
             badge = " [LATEST]" if index == 0 else ""
-            file_list.append(f"{file['name']}{badge}\n  Size: {display_size} | Downloaded: {date_str}")
+            file_list.append(f"{name}{badge}\n  Size: {display_size} | Downloaded: {date_str}")
 
         type_msg = f" (filtered to .{file_type} files)" if file_type else ""
         return [
@@ -451,32 +625,34 @@ class FileManagerServer:
         ]
 
     async def handle_unzip_latest(self, args: dict) -> list[TextContent]:
+        return await asyncio.to_thread(self._sync_unzip_latest, args)
+
+    def _sync_unzip_latest(self, args: dict) -> list[TextContent]:
         if not DOWNLOADS_DIR.exists():
             raise ValueError(f"Downloads directory not found: {DOWNLOADS_DIR}")
 
-        zip_files = [f for f in DOWNLOADS_DIR.iterdir() if f.is_file() and f.suffix.lower() == ".zip"]
+        zip_files = _zip_entries()
 
         if not zip_files:
             raise ValueError("No zip files found in Downloads")
 
-        # Get the most recent zip file
-        latest_zip = max(zip_files, key=lambda f: f.stat().st_mtime)
+        # Get the most recent zip file, reusing its DirEntry from the scan
+        latest_zip = max(zip_files, key=lambda e: e.stat().st_mtime)
 
-        # Use the existing unzip logic
-        result = await self.handle_unzip({
-            "filename": latest_zip.name,
-            "destination": args.get("destination"),
-        })
+        dest_dir = _destination_dir(args.get("destination"))
+        extract_path, file_list = self._do_unzip_core(latest_zip.path, dest_dir)
 
-        # Modify the message to indicate it was the latest
-        text = result[0].text.replace(
-            f"Successfully unzipped {latest_zip.name}",
-            f"Successfully unzipped the latest download: {latest_zip.name}",
-        )
-
-        return [TextContent(type="text", text=text)]
+        return [
+            TextContent(
+                type="text",
+                text=f"Successfully unzipped the latest download: {latest_zip.name} to {extract_path}\n\nExtracted {len(file_list)} files:\n" + _format_listing(file_list, len(file_list)),
+            )
+        ]
 
     async def handle_unzip_latest_and_move_svgs(self, args: dict) -> list[TextContent]:
+        return await asyncio.to_thread(self._sync_unzip_latest_and_move_svgs, args)
+
+    def _sync_unzip_latest_and_move_svgs(self, args: dict) -> list[TextContent]:
         destination_folder = args.get("destination_folder")
 
         if not destination_folder:
@@ -486,25 +662,30 @@ class FileManagerServer:
             raise ValueError(f"Downloads directory not found: {DOWNLOADS_DIR}")
 
         # Find the latest zip file
-        zip_files = [f for f in DOWNLOADS_DIR.iterdir() if f.is_file() and f.suffix.lower() == ".zip"]
+        zip_files = _zip_entries()
 
         if not zip_files:
             raise ValueError("No zip files found in Downloads")
 
-        latest_zip = max(zip_files, key=lambda f: f.stat().st_mtime)
+        latest_zip = max(zip_files, key=lambda e: e.stat().st_mtime)
+
+        return self._unzip_and_move_svgs(latest_zip.path, latest_zip.name, destination_folder)
+
+    def _do_unzip_core(self, zip_path: str, dest_dir: Path) -> tuple[Path, List[str]]:
+        extract_path = dest_dir / Path(zip_path).stem
+        return extract_path, _extract_zip(zip_path, os.fspath(extract_path))
 
-        # Use the existing unzip and move logic
-        return await self.handle_unzip_and_move_svgs({
-            "filename": latest_zip.name,
-            "destination_folder": destination_folder,
-        })
+    def _ensure_dir(self, path: Path) -> None:
+        # A single isdir() stat for directories created earlier this session,
+        # which still catches folders the user has since deleted
+        key = os.fspath(path)
+        if key in self._known_dirs and os.path.isdir(key):
+            return
+        path.mkdir(parents=True, exist_ok=True)
+        self._known_dirs.add(key)
 
-    async def find_files(self, directory: Path, extension: str) -> List[Path]:
-        results = []
-        for item in directory.rglob(f"*{extension}"):
-            if item.is_file():
-                results.append(item)
-        return results
+    def find_files(self, directory: Path, extension: str) -> Iterator[str]:
+        return _scandir_recursive(os.fspath(directory), extension.lower())
 
     async def run(self):
         async with stdio_server() as (read_stream, write_stream):